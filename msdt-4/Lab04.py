@@ -1,19 +1,42 @@
+import atexit
+import io
+import os
+import queue
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
 import logging
+from logging.handlers import QueueHandler, QueueListener
 from math import log10, sqrt
-from cmath import phase
 from PIL import Image
+import matplotlib
+if os.environ.get("DISPLAY") is None:
+    matplotlib.use("Agg")
 from matplotlib import pyplot as plt
-from scipy.signal import convolve2d
-
-
-logging.basicConfig(
-    filename="logger.log", level="INFO",
-    format="%(asctime)s %(levelname)s Line: %(lineno)d %(message)s"
-)
+from scipy.fft import fft2, ifft2, rfft2
+from scipy.ndimage import uniform_filter
+
+
+log_queue = queue.Queue(-1)
+log_file_handler = logging.FileHandler("logger.log")
+log_file_handler.setFormatter(logging.Formatter(
+    "%(asctime)s %(levelname)s Line: %(lineno)d %(message)s"
+))
+log_listener = QueueListener(log_queue, log_file_handler)
+log_listener.start()
+atexit.register(log_listener.stop)
+log_queue_handler = QueueHandler(log_queue)
+log_queue_handler.setFormatter(logging.Formatter("%(message)s"))
+logging.basicConfig(level="INFO", handlers=[log_queue_handler])
+_log = logging.getLogger(__name__)
 
 ALPHA = 1
-CVZ = np.random.normal(0, 1, size=[256, 256])
+SEED = 0
+RNG = np.random.default_rng(SEED)
+CVZ = RNG.standard_normal((256, 256))
+CVZ_FLAT = CVZ.ravel().astype(np.float32)
+CVZ_NORM = np.linalg.norm(CVZ_FLAT)
+CVZ_PADDED = np.zeros((512, 512), dtype=np.float32)
+CVZ_PADDED[128:384, 128:384] = CVZ
 
 
 def process_threshold(x):
@@ -21,7 +44,8 @@ def process_threshold(x):
     Applies a threshold to the input value x.
     """
     result = 1 if x > 0.1 else 0
-    logging.info(f"Applied threshold to {x}, result: {result}")
+    if _log.isEnabledFor(logging.INFO):
+        _log.info(f"Applied threshold to {x}, result: {result}")
     return result
 
 
@@ -31,11 +55,11 @@ def calculate_psnr(original, compressed):
     """
     mse = np.mean((original - compressed) ** 2)
     if mse == 0:
-        logging.warning("MSE is zero. PSNR value is set to 100")
+        _log.warning("MSE is zero. PSNR value is set to 100")
         return 100
     max_pixel = 255.0
     psnr_value = 20 * log10(max_pixel / sqrt(mse))
-    logging.info(f"Calculated PSNR: {psnr_value}")
+    _log.info(f"Calculated PSNR: {psnr_value}")
     return psnr_value
 
 
@@ -43,12 +67,23 @@ def calculate_psnr_alternative(c, cw):
     """
     Alternative method to calculate the PSNR.
     """
-    psnr_value = 10 * np.log10(np.power(255, 2) /
-                        np.mean(np.power((c - cw), 2)))
-    logging.info(f"Calculated alternative PSNR: {psnr_value}")
+    diff = np.asarray(c, dtype=np.float64) - cw
+    psnr_value = 10 * log10(65025.0 / np.mean(diff * diff))
+    _log.info(f"Calculated alternative PSNR: {psnr_value}")
     return psnr_value
 
 
+def extract_cvz_window(half_abs_spectrum):
+    """
+    Restores the [128:384, 128:384] window of the full magnitude spectrum
+    from the rfft2 half-spectrum of a real image (or of each image in a stack)
+    using Hermitian symmetry.
+    """
+    return np.concatenate((half_abs_spectrum[..., 128:384, 128:],
+                           half_abs_spectrum[..., 384:128:-1, 255:128:-1]),
+                          axis=-1)
+
+
 def select_best_alpha(image):
     """
     Selects the best alpha value automatically by maximizing PSNR.
@@ -56,58 +91,48 @@ def select_best_alpha(image):
     psnr = 0
     best_alpha = 0
     best_proximities = 0
-    logging.info("Selecting best alpha")
+    _log.info("Selecting best alpha")
+    image_array = np.asarray(image)  # Convert the image to the frequency domain using FFT
+    spectre_array = fft2(image_array, workers=-1)
+    phase_array = np.angle(spectre_array)
+    exp_phase = np.exp(phase_array * 1j)
+    original_abs_spectrum = np.abs(spectre_array).astype(np.float32, copy=False)
+    modified_abs_spectrum = np.empty_like(original_abs_spectrum)
+    modified_spectrum = np.empty_like(spectre_array)
+    reverse_float_array = np.empty(image_array.shape, dtype=np.float32)
     for alpha in range(1, 1001, 100):
-        logging.info(f"Testing alpha: {alpha}")
-        image_array = np.asarray(image)  # Convert the image to the frequency domain using FFT
-        spectre_array = np.fft.fft2(image_array)
-        get_phase = np.vectorize(phase)
-        phase_array = get_phase(spectre_array)
-
-        abs_spectrum = abs(spectre_array)
-        original_abs_spectrum = abs(spectre_array)
-        modified_abs_spectrum = abs_spectrum
-        modified_abs_spectrum[128:384, 128:384] = (
-                abs_spectrum[128:384, 128:384] + ALPHA * CVZ)
-        modified_spectrum = (modified_abs_spectrum *
-                           np.exp(phase_array * 1j))
-        reverse_array = abs(np.fft.ifft2(modified_spectrum))
-        reverse_image = Image.fromarray(reverse_array)
-        reverse_image.convert("RGB").save("img_with_cvz.png")
-
-        new_image = Image.open("img_with_cvz.png").convert("L")
-        reverse_array = np.asarray(new_image)
-        save_reverse_array = reverse_array
-        reverse_array = save_reverse_array.copy()
-        reverse_spectre_array = np.fft.fft2(reverse_array)
-        reverse_abs_spectrum = abs(reverse_spectre_array /
-                                np.exp(phase_array * 1j))  # Calculate the embedded CVZ noise in the modified spectrum
-        included_cvz = (reverse_abs_spectrum[128:384, 128:384] -
-                        original_abs_spectrum[128:384, 128:384]) / ALPHA
-        flatten_cvz = CVZ.flatten()
-        flatten_included_cvz = included_cvz.flatten()  # Compute the correlation between the original and embedded CVZ
-        p = sum(flatten_cvz * flatten_included_cvz) / (
-            ((sum(flatten_cvz ** 2)) ** (1 / 2)) *
-            ((sum(flatten_included_cvz ** 2)) ** (1 / 2)))
+        _log.info(f"Testing alpha: {alpha}")
+        np.multiply(CVZ_PADDED, alpha, out=modified_abs_spectrum)
+        np.add(modified_abs_spectrum, original_abs_spectrum, out=modified_abs_spectrum)
+        np.multiply(modified_abs_spectrum, exp_phase, out=modified_spectrum)
+        np.abs(ifft2(modified_spectrum, workers=-1, overwrite_x=True),
+               out=reverse_float_array)
+        np.clip(reverse_float_array, 0, 255, out=reverse_float_array)
+        np.trunc(reverse_float_array, out=reverse_float_array)
+        reverse_array = reverse_float_array.astype(np.uint8)
+        reverse_spectre_array = rfft2(reverse_float_array, workers=-1)
+        reverse_abs_spectrum = np.abs(reverse_spectre_array)  # Calculate the embedded CVZ noise in the modified spectrum
+        included_cvz = extract_cvz_window(reverse_abs_spectrum)
+        included_cvz -= original_abs_spectrum[128:384, 128:384]
+        included_cvz /= alpha
+        flatten_included_cvz = included_cvz.ravel()  # Compute the correlation between the original and embedded CVZ
+        p = calculate_cvz_proximity(flatten_included_cvz)
         included_cvz_estimation = process_threshold(p)
         if included_cvz_estimation:
-            reverse_array = np.asarray(reverse_array)
             new_psnr = calculate_psnr_alternative(image_array, reverse_array)
             if new_psnr > psnr:
                 psnr = new_psnr
                 best_alpha = alpha
                 best_proximities = p
-                logging.info(f"Found new best alpha: {best_alpha}, PSNR: {psnr}")
+                _log.info(f"Found new best alpha: {best_alpha}, PSNR: {psnr}")
     return(best_alpha, psnr, best_proximities)
 
 
 def generate_false_detection_vectors(count):
     """
-    Generates a list of false detection vectors (CVZ) with the specified count.
+    Generates a matrix of false detection vectors (CVZ), one row per vector, with the specified count.
     """
-    false_detection_cvz = []
-    for i in range(count):
-        false_detection_cvz.append(np.random.normal(0, 1, size=[65536]))
+    false_detection_cvz = RNG.standard_normal((count, 65536))
     return false_detection_cvz
 
 
@@ -115,9 +140,26 @@ def calculate_proximity(first_cvz, second_cvz):
     """
     Calculates the proximity between two vectors.
     """
-    proximity = sum(first_cvz * second_cvz) / (
-            ((sum(first_cvz ** 2)) ** (1 / 2)) *
-            ((sum(second_cvz ** 2)) ** (1 / 2)))
+    proximity = np.dot(first_cvz, second_cvz) / (
+            np.linalg.norm(first_cvz) * np.linalg.norm(second_cvz))
+    return proximity
+
+
+def calculate_proximities(cvz_matrix, cvz):
+    """
+    Calculates the proximity between each row of the matrix and the vector.
+    """
+    proximities = cvz_matrix @ cvz / (
+            np.linalg.norm(cvz_matrix, axis=1) * np.linalg.norm(cvz))
+    return proximities
+
+
+def calculate_cvz_proximity(flatten_extracted_cvz):
+    """
+    Calculates the proximity between the CVZ and an extracted CVZ vector (or each row of a matrix of them).
+    """
+    proximity = flatten_extracted_cvz @ CVZ_FLAT / (
+            np.linalg.norm(flatten_extracted_cvz, axis=-1) * CVZ_NORM)
     return proximity
 
 
@@ -125,236 +167,186 @@ def detect_false_proximity(false_detection_cvz, cvz):
     """
     Detects the proximity of false CVZ vectors relative to the given CVZ vector.
     """
-    false_detection_proximity_array = []
-    for false_cvz in false_detection_cvz:
-        false_detection_proximity_array.append(
-            calculate_proximity(cvz, false_cvz)
-        )
-    logging.info(f"False detection proximities: {false_detection_proximity_array}")
+    false_detection_proximity_array = calculate_proximities(false_detection_cvz, cvz)
+    _log.info(f"False detection proximities: {false_detection_proximity_array}")
     return false_detection_proximity_array
 
 
-def rotate_and_calculate_proximity(rotation_angle):
+def calculate_attacked_proximities(attacked_arrays):
     """
-    Rotates the image by an angle and get the proximity
+    Calculates the proximity between the CVZ and the CVZ extracted from each attacked image of the stack.
     """
-    rotated_image = reverse_image.rotate(rotation_angle)
-    rotated_image_array = np.asarray(rotated_image)
-    spectre_array = np.fft.fft2(rotated_image_array)
-    reverse_array = abs(np.fft.ifft2(spectre_array))
-    reverse_spectre_array = np.fft.fft2(reverse_array)
-    reverse_abs_spectrum = abs(reverse_spectre_array /
-                              np.exp(phase_array * 1j))
-    rotated_cvz = (reverse_abs_spectrum[128:384, 128:384] -
-                   original_abs_spectrum[128:384, 128:384]) / ALPHA
-    flatten_cvz = CVZ.flatten()
-    flatten_rotated_cvz = rotated_cvz.flatten()
-    p = sum(flatten_cvz * flatten_rotated_cvz) / (
-                ((sum(flatten_cvz ** 2)) ** (1 / 2)) *
-                ((sum(flatten_rotated_cvz ** 2)) ** (1 / 2)))
-    logging.info(f"Proximity after rotation by {rotation_angle} degrees: {p}")
-    return p
-
-
-def apply_cut_and_calculate_proximity(replacement_proportion):
+    reverse_spectre_array = rfft2(attacked_arrays.astype(np.float32, copy=False),
+                                  axes=(-2, -1), workers=-1)
+    reverse_abs_spectrum = np.abs(reverse_spectre_array)
+    attacked_cvz = extract_cvz_window(reverse_abs_spectrum)
+    attacked_cvz -= original_abs_spectrum[128:384, 128:384]
+    attacked_cvz /= ALPHA
+    flatten_attacked_cvz = attacked_cvz.reshape(len(attacked_arrays), -1)
+    return calculate_cvz_proximity(flatten_attacked_cvz)
+
+
+def rotate_and_calculate_proximity(rotation_angles):
     """
-    change the part of reversed image with part of original image and calculate proximity
+    Rotates the image by each angle and get the proximities
     """
-    reverse_array[
-        0:int(replacement_proportion * len(reverse_array)),
-        0:int(replacement_proportion * len(reverse_array))
-    ] = image_array[
-        0:int(replacement_proportion * len(image_array)):,
-        0:int(replacement_proportion * len(image_array))
-    ]
-    reverse_spectre_array = np.fft.fft2(reverse_array)
-    reverse_abs_spectrum = abs(reverse_spectre_array /
-                              np.exp(phase_array * 1j))
-    cut_cvz = (reverse_abs_spectrum[128:384, 128:384] -
-               original_abs_spectrum[128:384, 128:384]) / ALPHA
-    flatten_cvz = CVZ.flatten()
-    flatten_cut_cvz = cut_cvz.flatten()
-    p = sum(flatten_cvz * flatten_cut_cvz) / (
-                ((sum(flatten_cvz ** 2)) ** (1 / 2)) *
-                ((sum(flatten_cut_cvz ** 2)) ** (1 / 2)))
-    logging.info(f"Proximity after applying cut with {replacement_proportion} proportion: {p}")
-    return p
-
-
-def smooth_and_calculate_proximity(m):
+    rotated_image_arrays = np.stack([
+        np.asarray(reverse_image.rotate(rotation_angle))
+        for rotation_angle in rotation_angles
+    ])
+    proximities = calculate_attacked_proximities(rotated_image_arrays)
+    if _log.isEnabledFor(logging.INFO):
+        for rotation_angle, p in zip(rotation_angles, proximities):
+            _log.info(f"Proximity after rotation by {rotation_angle} degrees: {p}")
+    return proximities
+
+
+def apply_cut_and_calculate_proximity(replacement_proportions):
     """
-    Applies smoothing with a window of given size and calculates proximity.
+    change the part of reversed image with part of original image for each proportion and calculate proximities
     """
-    window = np.full((m, m), 1) / (m*m)
-    smooth_array = convolve2d(
-        reverse_image, window,
-        boundary="symm", mode="same"
-    )
-    spectre_array = np.fft.fft2(smooth_array)
-    reverse_array = abs(np.fft.ifft2(spectre_array))
-    reverse_spectre_array = np.fft.fft2(reverse_array)
-    reverse_abs_spectrum = abs(reverse_spectre_array /
-                              np.exp(phase_array * 1j))
-    rotated_cvz = (reverse_abs_spectrum[128:384, 128:384] -
-                   original_abs_spectrum[128:384, 128:384]) / ALPHA
-    flatten_cvz = CVZ.flatten()
-    flatten_smoothed_cvz = rotated_cvz.flatten()
-    p = sum(flatten_cvz * flatten_smoothed_cvz) / (
-                ((sum(flatten_cvz ** 2)) ** (1 / 2)) *
-                ((sum(flatten_smoothed_cvz ** 2)) ** (1 / 2)))
-    logging.info(f"Proximity after smoothing with {m} window size: {p}")
-    return p
-
-
-def compress_jpeg_and_calculate_proximity(qf):
+    cut_arrays = np.empty((len(replacement_proportions),) + reverse_array.shape,
+                          dtype=reverse_array.dtype)
+    for i, replacement_proportion in enumerate(replacement_proportions):
+        cut_size = int(replacement_proportion * len(reverse_array))
+        cut_arrays[i] = reverse_array
+        cut_arrays[i, 0:cut_size, 0:cut_size] = image_array[0:cut_size, 0:cut_size]
+    proximities = calculate_attacked_proximities(cut_arrays)
+    if _log.isEnabledFor(logging.INFO):
+        for replacement_proportion, p in zip(replacement_proportions, proximities):
+            _log.info(f"Proximity after applying cut with {replacement_proportion} proportion: {p}")
+    return proximities
+
+
+def smooth_and_calculate_proximity(window_sizes):
     """
-    Compresses the image to JPEG with the specified quality factor and calculates proximity.
+    Applies smoothing with windows of given sizes and calculates proximities.
+    """
+    reverse_image_array = np.asarray(reverse_image, dtype=np.float32)
+    smooth_arrays = np.stack([
+        uniform_filter(reverse_image_array, size=m, mode="reflect")
+        for m in window_sizes
+    ])
+    proximities = calculate_attacked_proximities(smooth_arrays)
+    if _log.isEnabledFor(logging.INFO):
+        for m, p in zip(window_sizes, proximities):
+            _log.info(f"Proximity after smoothing with {m} window size: {p}")
+    return proximities
+
+
+def compress_jpeg_and_calculate_proximity(quality_factors):
+    """
+    Compresses the image to JPEG with the specified quality factors and calculates proximities.
     """
     rgb_reverse_image = reverse_image.convert("RGB")
-    rgb_reverse_image.save("JPEG_image.jpg", quality=qf)
-    jpeg_image = Image.open("JPEG_image.jpg").convert("L")
-    jpeg_array = np.asarray(jpeg_image)
-    spectre_array = np.fft.fft2(jpeg_array)
-    reverse_array = abs(np.fft.ifft2(spectre_array))
-    reverse_spectre_array = np.fft.fft2(reverse_array)
-    reverse_abs_spectrum = abs(reverse_spectre_array /
-                              np.exp(phase_array * 1j))
-    rotated_cvz = (reverse_abs_spectrum[128:384, 128:384] -
-                   original_abs_spectrum[128:384, 128:384]) / ALPHA
-    flatten_cvz = CVZ.flatten()
-    flatten_jpeg_cvz = rotated_cvz.flatten()
-    p = sum(flatten_cvz * flatten_jpeg_cvz) / (
-                ((sum(flatten_cvz ** 2)) ** (1 / 2)) *
-                ((sum(flatten_jpeg_cvz ** 2)) ** (1 / 2)))
-    logging.info(f"Proximity after compress with {qf} quality factor: {p}")
-    return p
-
-
-flatten_CVZ = CVZ.flatten()
+    jpeg_arrays = []
+    for qf in quality_factors:
+        jpeg_buffer = io.BytesIO()
+        rgb_reverse_image.save(jpeg_buffer, format="JPEG", quality=int(qf))
+        jpeg_buffer.seek(0)
+        jpeg_image = Image.open(jpeg_buffer).convert("L")
+        jpeg_arrays.append(np.asarray(jpeg_image))
+    proximities = calculate_attacked_proximities(np.stack(jpeg_arrays))
+    if _log.isEnabledFor(logging.INFO):
+        for qf, p in zip(quality_factors, proximities):
+            _log.info(f"Proximity after compress with {qf} quality factor: {p}")
+    return proximities
+
+
 false_detection_cvz = generate_false_detection_vectors(100)
 false_detection_proximity_array = (
-    detect_false_proximity(false_detection_cvz, CVZ.flatten()))
-
-x = np.arange(0, 100, 1)
-y = false_detection_proximity_array
-plt.xlabel("X axis")
-plt.ylabel("Y axis")
-plt.plot(x, y, color="red")
-plt.show()
+    detect_false_proximity(false_detection_cvz, CVZ_FLAT))
 
-logging.info("Loading image and converting to array")
+_log.info("Loading image and converting to array")
 image = Image.open("bridge.tif")
 image_array = np.asarray(image)
 
-logging.info("Transforming image to frequency domain")
-spectre_array = np.fft.fft2(image_array)
-get_phase = np.vectorize(phase)
-phase_array = get_phase(spectre_array)
-abs_spectrum = abs(spectre_array)
-original_abs_spectrum = abs(spectre_array)
-
-logging.info("Embedding CVZ into image")
-modified_abs_spectrum = abs_spectrum
-modified_abs_spectrum[128:384, 128:384] = (
-        abs_spectrum[128:384, 128:384] + ALPHA*CVZ)
-modified_spectrum = modified_abs_spectrum * np.exp(phase_array*1j)
-reverse_array = abs(np.fft.ifft2(modified_spectrum))
-reverse_image = Image.fromarray(reverse_array)
-reverse_image.convert("RGB").save("img_with_cvz.png")
-
-logging.info("Evaluating embedded CVZ")
-new_image = Image.open("img_with_cvz.png").convert("L")
-reverse_array = np.asarray(new_image)
-save_reverse_array = reverse_array
-reverse_array = save_reverse_array.copy()
-reverse_spectre_array = np.fft.fft2(reverse_array)
-reverse_abs_spectrum = abs(reverse_spectre_array /
-                          np.exp(phase_array*1j))
-included_cvz = (reverse_abs_spectrum[128:384, 128:384] -
+_log.info("Transforming image to frequency domain")
+spectre_array = fft2(image_array, workers=-1)
+phase_array = np.angle(spectre_array)
+exp_phase = np.exp(phase_array*1j)
+original_abs_spectrum = np.abs(spectre_array).astype(np.float32, copy=False)
+
+_log.info("Embedding CVZ into image")
+modified_abs_spectrum = original_abs_spectrum + ALPHA*CVZ_PADDED
+modified_spectrum = modified_abs_spectrum * exp_phase
+reverse_array = np.abs(ifft2(modified_spectrum, workers=-1)).astype(np.float32)
+reverse_array = np.clip(reverse_array, 0, 255).astype(np.uint8)
+Image.fromarray(reverse_array).convert("RGB").save("img_with_cvz.png")
+
+_log.info("Evaluating embedded CVZ")
+reverse_spectre_array = rfft2(reverse_array.astype(np.float32), workers=-1)
+reverse_abs_spectrum = np.abs(reverse_spectre_array)
+included_cvz = (extract_cvz_window(reverse_abs_spectrum) -
                 original_abs_spectrum[128:384, 128:384]) / ALPHA
-flatten_cvz = CVZ.flatten()
 flatten_included_cvz = included_cvz.flatten()
-p = (sum(flatten_cvz*flatten_included_cvz) /
-     (((sum(flatten_cvz**2))**(1/2)) *
-      ((sum(flatten_included_cvz**2))**(1/2))))
+p = calculate_cvz_proximity(flatten_included_cvz)
 included_cvz_estimation = process_threshold(p)
-logging.info(f"Threshold p-value for included CVZ: {p}, inclusion estimation: {included_cvz_estimation}")
-reverse_image = Image.fromarray(reverse_array)
+_log.info(f"Threshold p-value for included CVZ: {p}, inclusion estimation: {included_cvz_estimation}")
+reverse_image = Image.fromarray(reverse_array.copy())
+attack_executor = ThreadPoolExecutor(max_workers=4)
 
 
 # CUT
-logging.info("Starting CUT analysis")
+_log.info("Starting CUT analysis")
 cut_param_array = np.arange(0.55, 1.45, 0.15)
-cut_proximities = []
-for cut_param in cut_param_array:
-    proximity = apply_cut_and_calculate_proximity(cut_param)
-    cut_proximities.append(proximity)
-    logging.debug(f"CUT parameter: {cut_param}, proximity: {proximity}")
+cut_future = attack_executor.submit(apply_cut_and_calculate_proximity, cut_param_array)
 
 
 # ROTATION
-logging.info("Starting ROTATION analysis")
+_log.info("Starting ROTATION analysis")
 rotation_param_array = np.arange(1, 90, 8.9)
-rotation_proximities = []
-for rotation_param in rotation_param_array:
-    proximity = rotate_and_calculate_proximity(rotation_param)
-    rotation_proximities.append(proximity)
-    logging.debug(f"ROTATION parameter: {rotation_param}, proximity: {proximity}")
+rotation_future = attack_executor.submit(rotate_and_calculate_proximity, rotation_param_array)
 
 
 # SMOOTH
-logging.info("Starting SMOOTH analysis")
+_log.info("Starting SMOOTH analysis")
 smooth_param_array = np.arange(3, 15, 2)
-smooth_proximities = []
-for smooth_param in smooth_param_array:
-    proximity = smooth_and_calculate_proximity(smooth_param)
-    smooth_proximities.append(proximity)
-    logging.debug(f"SMOOTH parameter: {smooth_param}, proximity: {proximity}")
+smooth_future = attack_executor.submit(smooth_and_calculate_proximity, smooth_param_array)
 
 
 # JPEG
-logging.info("Starting JPEG compression analysis")
+_log.info("Starting JPEG compression analysis")
 jpeg_param_array = np.arange(30, 91, 10)
-jpeg_proximities = []
-for jpeg_param in jpeg_param_array:
-    proximity = compress_jpeg_and_calculate_proximity(int(jpeg_param))
-    jpeg_proximities.append(proximity)
-    logging.debug(f"JPEG quality parameter: {jpeg_param}, proximity: {proximity}")
+jpeg_future = attack_executor.submit(compress_jpeg_and_calculate_proximity, jpeg_param_array)
+
+
+# RESULTS
+_log.info("Collecting attack analysis results")
+cut_proximities = cut_future.result()
+rotation_proximities = rotation_future.result()
+smooth_proximities = smooth_future.result()
+jpeg_proximities = jpeg_future.result()
+attack_executor.shutdown()
+if _log.isEnabledFor(logging.DEBUG):
+    for cut_param, proximity in zip(cut_param_array, cut_proximities):
+        _log.debug(f"CUT parameter: {cut_param}, proximity: {proximity}")
+    for rotation_param, proximity in zip(rotation_param_array, rotation_proximities):
+        _log.debug(f"ROTATION parameter: {rotation_param}, proximity: {proximity}")
+    for smooth_param, proximity in zip(smooth_param_array, smooth_proximities):
+        _log.debug(f"SMOOTH parameter: {smooth_param}, proximity: {proximity}")
+    for jpeg_param, proximity in zip(jpeg_param_array, jpeg_proximities):
+        _log.debug(f"JPEG quality parameter: {jpeg_param}, proximity: {proximity}")
 
 
 # OUTPUT
-logging.info("Construction CUT process graph")
-x = cut_param_array
-y = cut_proximities
-plt.title("CUT")
-plt.xlabel("X axis")
-plt.ylabel("Y axis")
-plt.plot(x, y, color="red")
-plt.show()
-
-logging.info("Construction ROTATION process graph")
-x = rotation_param_array
-y = rotation_proximities
-plt.title("ROTATION")
-plt.xlabel("X axis")
-plt.ylabel("Y axis")
-plt.plot(x, y, color="red")
-plt.show()
-
-logging.info("Construction SMOOTH process graph")
-x = smooth_param_array
-y = smooth_proximities
-plt.title("SMOOTH")
-plt.xlabel("X axis")
-plt.ylabel("Y axis")
-plt.plot(x, y, color="red")
-plt.show()
-
-logging.info("Construction JPEG process graph")
-x = jpeg_param_array
-y = jpeg_proximities
-plt.title("JPEG")
-plt.xlabel("X axis")
-plt.ylabel("Y axis")
-plt.plot(x, y, color="red")
-plt.show()
\ No newline at end of file
+_log.info("Construction process graphs")
+graphs = [
+    ("FALSE DETECTION", np.arange(0, 100, 1), false_detection_proximity_array),
+    ("CUT", cut_param_array, cut_proximities),
+    ("ROTATION", rotation_param_array, rotation_proximities),
+    ("SMOOTH", smooth_param_array, smooth_proximities),
+    ("JPEG", jpeg_param_array, jpeg_proximities),
+]
+fig, axes = plt.subplots(2, 3, figsize=(15, 10))
+for ax, (title, x, y) in zip(axes.flat, graphs):
+    ax.set_title(title)
+    ax.set_xlabel("X axis")
+    ax.set_ylabel("Y axis")
+    ax.plot(x, y, color="red")
+for ax in axes.flat[len(graphs):]:
+    ax.set_axis_off()
+fig.tight_layout()
+fig.savefig("results.png")
+plt.close(fig)
+_log.info("Saved process graphs to results.png")